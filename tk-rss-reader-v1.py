@@ -1,35 +1,76 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
-import feedparser
-import json
+import tkinter.font as tkfont
+import fastfeedparser
+import requests
+from requests.adapters import HTTPAdapter
+import orjson
+import os
 import sqlite3
 import webbrowser
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import threading
+import queue
+import itertools
+import time
+from operator import attrgetter
+from dataclasses import dataclass
+
+# Sort key for entries: the epoch timestamp, so sorting compares floats.
+by_timestamp = attrgetter('ts')
+
+# Colors for light (False) and dark (True) mode, and the ttk styles they apply to.
+PALETTES = {
+    False: {'bg': 'white', 'fg': 'black'},
+    True: {'bg': '#333333', 'fg': 'white'}
+}
+STYLE_TARGETS = ('TFrame', 'TLabel', 'TCheckbutton', 'Treeview', 'Treeview.Heading')
+
+@dataclass(slots=True)
+class Entry:
+    id: str  # Treeview row id
+    title: str
+    link: str
+    published: datetime
+    ts: float  # epoch seconds, used for sorting and the age cutoff
+    published_display: str
+    published_db: str
+    feed: str
 
 class RSSDatabase:
     def __init__(self):
         self.conn = sqlite3.connect('rss_entries.db')
+        # Only takes effect when the database file is first created.
+        self.conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        # WAL with NORMAL sync: one fsync per checkpoint instead of per commit.
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
         self.create_table()
 
     def create_table(self):
-        cursor = self.conn.cursor()
-        cursor.execute('''CREATE TABLE IF NOT EXISTS saved_entries
-                          (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                           title TEXT,
-                           link TEXT,
-                           published TEXT)''')
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute('''CREATE TABLE IF NOT EXISTS saved_entries
+                                 (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                  title TEXT,
+                                  link TEXT,
+                                  published TEXT)''')
+            index_exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_saved_link'").fetchone()
+            if not index_exists:
+                # One-off migration: drop duplicates saved before links were unique, keeping the
+                # oldest row. NULL links are left alone, since the index allows repeats of those.
+                self.conn.execute('''DELETE FROM saved_entries WHERE link IS NOT NULL AND id NOT IN
+                                     (SELECT MIN(id) FROM saved_entries GROUP BY link)''')
+                self.conn.execute('CREATE UNIQUE INDEX idx_saved_link ON saved_entries (link)')
 
     def save_entry(self, entry):
-        # Convert datetime to ISO formatted string if necessary.
-        published = entry['published']
-        if isinstance(published, datetime):
-            published = published.strftime('%Y-%m-%d %H:%M:%S')
-        cursor = self.conn.cursor()
-        cursor.execute('INSERT INTO saved_entries (title, link, published) VALUES (?, ?, ?)',
-                       (entry['title'], entry['link'], published))
-        self.conn.commit()
+        self.save_entries([entry])
+
+    def save_entries(self, entries):
+        rows = [(entry.title, entry.link, entry.published_db) for entry in entries]
+        # Insert all rows in a single transaction.
+        with self.conn:
+            self.conn.executemany('INSERT OR IGNORE INTO saved_entries (title, link, published) VALUES (?, ?, ?)', rows)
 
 class RSSSettings:
     def __init__(self):
@@ -44,16 +85,34 @@ class RSSSettings:
         self.load_settings()
 
     def load_settings(self):
+        self.dirty = False
         try:
-            with open(self.settings_file, 'r') as f:
-                self.settings = json.load(f)
+            with open(self.settings_file, 'rb') as f:
+                self.settings = orjson.loads(f.read())
         except FileNotFoundError:
             self.settings = self.default_settings
+            self.dirty = True
             self.save_settings()
 
     def save_settings(self):
-        with open(self.settings_file, 'w') as f:
-            json.dump(self.settings, f)
+        if not self.dirty:
+            return
+        # Write to a temporary file, flush it to disk, then rename it, so neither a crash nor
+        # a power loss leaves a half-written or empty settings file.
+        tmp_file = self.settings_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.settings, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        self.dirty = False
 
 class RSSApp:
     def __init__(self, root):
@@ -62,12 +121,42 @@ class RSSApp:
         self.db = RSSDatabase()
         self.settings = RSSSettings()
         self.entries = []
-        self.selected_entries = set()
+        # Entries keyed by id (= Treeview row id), so selections resolve without a scan.
+        self.entries_by_id = {}
+        # Only one page of entries is shown at a time, and at most max_entries are kept.
+        self.page_size = 100
+        self.page = 0
+        self.max_entries = 1000
+        # Stable ids for entries, used as Treeview row ids.
+        self.entry_ids = itertools.count()
+        # Links already listed (or deleted by the user); refreshes only add entries not in here.
+        self.known_links = set()
+        # Known links no longer listed (deleted or past the cap), with their timestamps, so
+        # they can be forgotten once they fall behind the cutoff.
+        self.dropped_links = {}
+        # Per-feed (ETag, Last-Modified) validators from the last successful fetch. Only the
+        # Tk thread writes it; the generation is bumped on every clear, so a refresh that
+        # started before a clear cannot write stale validators back.
+        self.http_cache = {}
+        self.http_cache_generation = 0
+        # One pooled HTTP session so connections are reused across feeds and refreshes.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.current_sort = 'date'
+        # A single worker thread runs refreshes; requests made while one is pending are dropped.
+        self.refresh_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self.refresh_worker, daemon=True).start()
+        # Feeds are fetched concurrently by a fixed set of daemon threads, so closing the
+        # app mid-refresh exits at once instead of waiting for outstanding downloads.
+        self.fetch_queue = queue.Queue()
+        for _ in range(8):
+            threading.Thread(target=self.fetch_worker, daemon=True).start()
 
         self.setup_ui()
         self.apply_settings()
-        self.load_feeds()
+        # start_auto_refresh also performs the initial load.
         self.start_auto_refresh()
 
     def setup_ui(self):
@@ -87,6 +176,9 @@ class RSSApp:
         settings_menu.add_command(label="App Settings", command=self.open_settings)
         self.menu_bar.add_cascade(label="Settings", menu=settings_menu)
 
+        # Classic Tk widgets ignore ttk styles, so apply_settings colors these directly.
+        self.tk_widgets = (self.menu_bar, file_menu, settings_menu)
+
         # Configure styles
         self.style = ttk.Style()
         self.style.theme_use('clam')  # always use 'clam' and then adjust colors
@@ -102,141 +194,278 @@ class RSSApp:
         ttk.Button(toolbar, text="Refresh", command=self.load_feeds).pack(side=tk.LEFT)
         ttk.Button(toolbar, text="Delete Selected", command=self.delete_selected).pack(side=tk.LEFT)
         ttk.Button(toolbar, text="Save to DB", command=self.save_selected_to_db).pack(side=tk.LEFT)
-
-        # Entries list inside a Canvas with a Scrollbar
-        self.canvas = tk.Canvas(self.main_frame)
-        self.scrollbar = ttk.Scrollbar(self.main_frame, orient="vertical", command=self.canvas.yview)
-        self.entries_frame = ttk.Frame(self.canvas)
-
-        self.entries_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.create_window((0, 0), window=self.entries_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        ttk.Button(toolbar, text="Next", command=lambda: self.change_page(1)).pack(side=tk.RIGHT)
+        self.page_label = ttk.Label(toolbar, text="Page 1 / 1")
+        self.page_label.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(toolbar, text="Prev", command=lambda: self.change_page(-1)).pack(side=tk.RIGHT)
+
+        # Entries list: a Treeview only draws the rows that are visible.
+        self.tree = ttk.Treeview(self.main_frame, columns=('date', 'title'), show='headings', selectmode='extended')
+        self.tree.heading('date', text="Published", anchor="w")
+        self.tree.heading('title', text="Title", anchor="w")
+        self.tree.column('date', width=150, stretch=False)
+        self.tree.column('title', width=600)
+        self.scrollbar = ttk.Scrollbar(self.main_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Bind mouse wheel events for scrolling (Windows/Mac and Linux)
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind("<Button-4>", self._on_mousewheel_linux)
-        self.canvas.bind("<Button-5>", self._on_mousewheel_linux)
+        # Double-click an entry to open it in the browser.
+        self.tree.bind("<Double-1>", self.open_entry)
 
-    def _on_mousewheel(self, event):
-        # For Windows and MacOS, scrolling is handled via event.delta.
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # One wheel handler for the whole app (Windows/Mac and Linux), so scrolling works
+        # anywhere in the main window, not only over the list.
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.root.bind_all("<Button-4>", self._on_mousewheel)
+        self.root.bind_all("<Button-5>", self._on_mousewheel)
 
-    def _on_mousewheel_linux(self, event):
-        # For Linux, mouse wheel events use Button-4 (up) and Button-5 (down).
-        if event.num == 4:
-            self.canvas.yview_scroll(-1, "units")
-        elif event.num == 5:
-            self.canvas.yview_scroll(1, "units")
+    def _on_mousewheel(self, event):
+        widget = event.widget
+        # The Treeview scrolls itself, and other windows (e.g. Settings) keep their own scrolling.
+        if widget is self.tree or isinstance(widget, str) or widget.winfo_toplevel() is not self.root:
+            return
+        # Linux reports Button-4 (up) / Button-5 (down); Windows and MacOS report event.delta.
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self.tree.yview_scroll(step, "units")
 
     def configure_styles(self):
-        # Configure base font size.
+        # Configure base font size; colors are set by apply_settings.
         self.style.configure('.', font=('Arial', self.settings.settings['font_size']))
-        # Light mode default styles.
-        self.style.configure('TFrame', background='white')
-        self.style.configure('TLabel', foreground='black', background='white')
-        self.style.configure('TCheckbutton', background='white')
-
-        # Custom styles for dark mode.
-        self.style.configure('Dark.TFrame', background='#333333')
-        self.style.configure('Dark.TLabel', foreground='white', background='#333333')
-        self.style.configure('Dark.TCheckbutton', background='#333333')
+        # Fit the row height to the configured font.
+        font_height = tkfont.Font(font=('Arial', self.settings.settings['font_size'])).metrics('linespace')
+        self.style.configure('Treeview', rowheight=font_height + 4)
 
     def apply_settings(self):
-        dark_mode = self.settings.settings['dark_mode']
-        bg = '#333333' if dark_mode else 'white'
-        fg = 'white' if dark_mode else 'black'
+        palette = PALETTES[self.settings.settings['dark_mode']]
+        bg, fg = palette['bg'], palette['fg']
 
         # Update the root window background.
         self.root.config(bg=bg)
 
         # Update styles based on dark mode.
-        if dark_mode:
-            self.style.configure('TFrame', background='#333333')
-            self.style.configure('TLabel', foreground='white', background='#333333')
-            self.style.configure('TCheckbutton', background='#333333')
-        else:
-            self.style.configure('TFrame', background='white')
-            self.style.configure('TLabel', foreground='black', background='white')
-            self.style.configure('TCheckbutton', background='white')
-
-        # Update widget colors recursively.
-        self.update_widget_colors(self.root, bg, fg)
-
-    def update_widget_colors(self, widget, bg, fg):
-        try:
-            if isinstance(widget, (tk.Listbox, tk.Entry, tk.Canvas)):
-                widget.config(bg=bg, fg=fg, insertbackground=fg)
-            else:
-                widget.config(bg=bg, fg=fg)
-        except tk.TclError:
-            pass
+        for target in STYLE_TARGETS:
+            self.style.configure(target, background=bg, foreground=fg)
+        self.style.configure('Treeview', fieldbackground=bg)
 
-        for child in widget.winfo_children():
-            self.update_widget_colors(child, bg, fg)
+        # ttk widgets follow the styles above; only classic Tk widgets need direct config.
+        for widget in self.tk_widgets:
+            widget.config(bg=bg, fg=fg)
 
     def open_settings(self):
         SettingsWindow(self)
 
+    def fetch_feed(self, feed_url):
+        # Conditional GET: returns (feed, validators), with feed None on 304 Not Modified.
+        # The caller stores the validators once the feed's entries are processed.
+        headers = {}
+        etag, modified = self.http_cache.get(feed_url, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+        # requests negotiates gzip/deflate compression and decodes the body itself.
+        response = self.session.get(feed_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return None, None
+        response.raise_for_status()
+        content = response.content
+        validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        # Only title, link and published are used, so skip parsing everything else.
+        feed = fastfeedparser.parse(content, include_content=False, include_tags=False,
+                                    include_media=False, include_enclosures=False)
+        return feed, validators
+
     def load_feeds(self):
-        def fetch_feeds():
-            new_entries = []
-            cutoff_date = datetime.now() - timedelta(days=self.settings.settings['days'])
-            
-            for feed_url in self.settings.settings['feeds']:
-                try:
-                    feed = feedparser.parse(feed_url)
-                    for entry in feed.entries:
-                        if hasattr(entry, 'published_parsed'):
-                            published = datetime(*entry.published_parsed[:6])
-                        else:
-                            published = datetime.now()
-                        if published >= cutoff_date:
-                            new_entries.append({
-                                'title': entry.title,
-                                'link': entry.link,
-                                'published': published,
-                                'feed': feed_url
-                            })
-                except Exception as e:
-                    self.root.after(0, lambda url=feed_url, err=str(e): 
-                                    messagebox.showerror("Error", f"Failed to load feed: {url}\n{err}"))
-            
-            new_entries.sort(key=lambda x: x['published'], reverse=True)
-            self.entries = new_entries
-            self.root.after(0, self.display_entries)
+        try:
+            self.refresh_queue.put_nowait(True)
+        except queue.Full:
+            pass  # A refresh is already pending.
+
+    def refresh_worker(self):
+        while True:
+            self.refresh_queue.get()
+            # This is the only refresh thread, so report errors instead of letting it die.
+            try:
+                self.refresh_feeds()
+            except Exception as e:
+                self.root.after(0, messagebox.showerror, "Error", f"Failed to refresh feeds:\n{e}")
 
-        threading.Thread(target=fetch_feeds, daemon=True).start()
+    def clear_http_cache(self):
+        self.http_cache.clear()
+        self.http_cache_generation += 1
 
-    def display_entries(self):
-        for widget in self.entries_frame.winfo_children():
-            widget.destroy()
+    def fetch_worker(self):
+        while True:
+            feed_url, results = self.fetch_queue.get()
+            try:
+                results.put((feed_url, self.fetch_feed(feed_url), None))
+            except Exception as e:
+                results.put((feed_url, None, e))
+
+    def refresh_feeds(self):
+        candidates = []
+        validators_by_feed = {}
+        generation = self.http_cache_generation
+        cutoff_ts = (datetime.now() - timedelta(days=self.settings.settings['days'])).timestamp()
+        # Same cutoff as a UTC ISO-8601 string, comparable with fastfeedparser's dates as text.
+        cutoff_iso = datetime.fromtimestamp(int(cutoff_ts), timezone.utc).isoformat()
+        feeds = list(self.settings.settings['feeds'])
+        # Snapshot, since the main thread updates known_links.
+        known_links = frozenset(self.known_links)
+
+        # Fetch all feeds concurrently; the work is network-bound.
+        results = queue.Queue()
+        for feed_url in feeds:
+            self.fetch_queue.put((feed_url, results))
+        for _ in feeds:
+            # Results arrive in completion order.
+            feed_url, result, error = results.get()
+            try:
+                if error is not None:
+                    raise error
+                feed, validators = result
+                # An unchanged feed (304) has nothing new to add.
+                if feed is None:
+                    continue
+                for entry in feed.entries:
+                    if entry.link in known_links:
+                        continue
+                    # fastfeedparser normalizes dates to ISO-8601 UTC strings, so old
+                    # entries can be skipped before building a datetime for them.
+                    published_iso = entry.get('published')
+                    if published_iso and published_iso.endswith('+00:00') and published_iso < cutoff_iso:
+                        continue
+                    try:
+                        parsed = datetime.fromisoformat(published_iso)
+                        ts = parsed.timestamp()
+                        published = parsed.replace(tzinfo=None)
+                    except (AttributeError, TypeError, ValueError):
+                        published = datetime.now()
+                        ts = time.time()
+                    if ts < cutoff_ts:
+                        continue
+                    candidates.append(Entry(
+                        id=str(next(self.entry_ids)),
+                        title=entry.title,
+                        link=entry.link,
+                        published=published,
+                        ts=ts,
+                        # Formatted once here rather than on every redraw, export or save.
+                        published_display=published.strftime('%Y-%m-%d %H:%M'),
+                        published_db=published.strftime('%Y-%m-%d %H:%M:%S'),
+                        feed=feed_url
+                    ))
+                # Only now can a 304 safely mean "nothing new" for this feed.
+                validators_by_feed[feed_url] = validators
+            except Exception as e:
+                self.root.after(0, lambda url=feed_url, err=str(e):
+                                messagebox.showerror("Error", f"Failed to load feed: {url}\n{err}"))
+
+        # Hand the results to the Tk main thread, which owns self.entries.
+        self.root.after(0, self.merge_entries, candidates, cutoff_ts, feeds,
+                        validators_by_feed, generation)
+
+    def merge_entries(self, candidates, cutoff_ts, feeds, validators_by_feed, generation):
+        # Validators fetched under a since-cleared cache (e.g. an older cutoff) are dropped.
+        if generation == self.http_cache_generation:
+            self.http_cache.update(validators_by_feed)
+
+        new_entries = []
+        for entry in candidates:
+            # The same link can come from two feeds in one refresh.
+            if entry.link not in self.known_links:
+                self.known_links.add(entry.link)
+                new_entries.append(entry)
+
+        # Drop entries that aged out or whose feed was removed. Their links are forgotten
+        # so they can return; deleted entries stay known and so stay deleted. The feed's
+        # validators go too, so the next fetch is a full one rather than a 304.
+        feeds = set(feeds)
+        for feed_url in list(self.http_cache):
+            if feed_url not in feeds:
+                self.http_cache.pop(feed_url, None)
+        entries = []
+        for entry in self.entries:
+            if entry.ts >= cutoff_ts and entry.feed in feeds:
+                entries.append(entry)
+            else:
+                self.known_links.discard(entry.link)
+                self.http_cache.pop(entry.feed, None)
+        entries.extend(new_entries)
+        entries.sort(key=by_timestamp, reverse=True)
+        # Entries past the cap are treated like deleted ones: their links stay known and the
+        # feed keeps its validators, so they are not fetched and trimmed again every refresh.
+        for entry in entries[self.max_entries:]:
+            self.dropped_links[entry.link] = entry.ts
+        del entries[self.max_entries:]
+
+        # Dropped links older than the cutoff would be skipped anyway, so stop tracking them.
+        for link, ts in list(self.dropped_links.items()):
+            if ts < cutoff_ts:
+                del self.dropped_links[link]
+                self.known_links.discard(link)
+
+        self.entries = entries
+        self.entries_by_id = {entry.id: entry for entry in entries}
+        self.display_entries()
 
-        for idx, entry in enumerate(self.entries):
-            entry_frame = ttk.Frame(self.entries_frame)
-            entry_frame.pack(fill=tk.X, pady=2)
+    def display_entries(self):
+        # Keep the page in range, since entries may have been deleted or refreshed away.
+        page_count = max(1, -(-len(self.entries) // self.page_size))
+        self.page = min(max(self.page, 0), page_count - 1)
+        self.page_label.config(text=f"Page {self.page + 1} / {page_count}")
+        start = self.page * self.page_size
+        page_entries = self.entries[start:start + self.page_size]
+
+        # Only touch rows that changed: drop stale ones, insert new ones, reorder the rest.
+        wanted = [entry.id for entry in page_entries]
+        stale = set(self.tree.get_children()).difference(wanted)
+        if stale:
+            self.tree.delete(*stale)
+        current = list(self.tree.get_children())
+        if current == wanted:
+            return
+        existing = set(current)
+        for index, entry in enumerate(page_entries):
+            # Rows already in place are left alone, so inserting new rows moves nothing.
+            if index < len(current) and current[index] == entry.id:
+                continue
+            if entry.id in existing:
+                current.remove(entry.id)
+                self.tree.move(entry.id, '', index)
+            else:
+                self.tree.insert('', index, iid=entry.id,
+                                 values=(entry.published_display, entry.title))
+            current.insert(index, entry.id)
 
-            chk_var = tk.IntVar()
-            ttk.Checkbutton(entry_frame, variable=chk_var, 
-                          command=lambda i=idx: self.toggle_selection(i)).pack(side=tk.LEFT)
+    def change_page(self, step):
+        self.page += step
+        self.display_entries()
+        self.tree.yview_moveto(0)
 
-            entry_text = f"{entry['published'].strftime('%Y-%m-%d %H:%M')} - {entry['title']}"
-            label = ttk.Label(entry_frame, text=entry_text, cursor="hand2")
-            label.pack(side=tk.LEFT, padx=5)
-            label.bind("<Button-1>", lambda e, link=entry['link']: webbrowser.open(link))
+    def get_selected_entries(self):
+        # The Treeview owns the selection; return the entries newest first, as listed.
+        selected = [self.entries_by_id[iid] for iid in self.tree.selection()]
+        selected.sort(key=by_timestamp, reverse=True)
+        return selected
 
-    def toggle_selection(self, index):
-        if index in self.selected_entries:
-            self.selected_entries.remove(index)
-        else:
-            self.selected_entries.add(index)
+    def open_entry(self, event):
+        iid = self.tree.identify_row(event.y)
+        if iid:
+            webbrowser.open(self.entries_by_id[iid].link)
 
     def delete_selected(self):
-        for index in sorted(self.selected_entries, reverse=True):
-            del self.entries[index]
-        self.selected_entries.clear()
+        selection = self.tree.selection()
+        if not selection:
+            return
+        for iid in selection:
+            entry = self.entries_by_id.pop(iid)
+            # Stays in known_links so it does not come back; pruned once it ages out.
+            self.dropped_links[entry.link] = entry.ts
+        self.entries = [entry for entry in self.entries if entry.id in self.entries_by_id]
+        self.tree.delete(*selection)
+        # Pull the following entries up into the current page.
         self.display_entries()
 
     def export_selected(self):
@@ -244,9 +473,8 @@ class RSSApp:
         if file_path:
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    for index in self.selected_entries:
-                        entry = self.entries[index]
-                        f.write(f"{entry['title']}\n{entry['link']}\n\n")
+                    for entry in self.get_selected_entries():
+                        f.write(f"{entry.title}\n{entry.link}\n\n")
                 messagebox.showinfo("Export", "Entries exported successfully.")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export entries:\n{str(e)}")
@@ -259,17 +487,14 @@ class RSSApp:
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     # Export each selected entry as a markdown list item.
-                    for index in sorted(self.selected_entries):
-                        entry = self.entries[index]
-                        published = entry['published'].strftime('%Y-%m-%d %H:%M')
-                        f.write(f"- [{entry['title']}]({entry['link']}) - {published}\n")
+                    for entry in self.get_selected_entries():
+                        f.write(f"- [{entry.title}]({entry.link}) - {entry.published_display}\n")
                 messagebox.showinfo("Export", "Entries exported in Markdown format.")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export entries:\n{str(e)}")
 
     def save_selected_to_db(self):
-        for index in self.selected_entries:
-            self.db.save_entry(self.entries[index])
+        self.db.save_entries(self.get_selected_entries())
         messagebox.showinfo("Info", "Selected entries saved to database")
 
     def start_auto_refresh(self):
@@ -345,16 +570,26 @@ class SettingsWindow(tk.Toplevel):
 
     def save_settings(self):
         try:
-            self.parent.settings.settings['feeds'] = [url for url in self.feeds_list.get(0, tk.END) if url.strip()]
-            self.parent.settings.settings['days'] = int(self.days_entry.get())
-            self.parent.settings.settings['font_size'] = int(self.font_entry.get())
-            self.parent.settings.settings['refresh_interval'] = int(self.refresh_entry.get())
-            self.parent.settings.settings['dark_mode'] = self.dark_mode_var.get()
+            new_settings = {
+                'feeds': [url for url in self.feeds_list.get(0, tk.END) if url.strip()],
+                'days': int(self.days_entry.get()),
+                'font_size': int(self.font_entry.get()),
+                'refresh_interval': int(self.refresh_entry.get()),
+                'dark_mode': self.dark_mode_var.get()
+            }
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numerical values for Days, Font Size, and Refresh Interval.")
             return
 
-        self.parent.settings.save_settings()
+        # Only rewrite the settings file when something actually changed.
+        settings = self.parent.settings
+        # Items skipped by the old cutoff must be fetched again, so forget the cached validators.
+        if settings.settings.get('days') != new_settings['days']:
+            self.parent.clear_http_cache()
+        if any(settings.settings.get(key) != value for key, value in new_settings.items()):
+            settings.settings.update(new_settings)
+            settings.dirty = True
+        settings.save_settings()
         self.parent.apply_settings()
         self.parent.load_feeds()
         self.destroy()